@@ -0,0 +1,30 @@
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0005_recipe_image'),
+    ]
+
+    # The auto-created unique constraints cover (recipe_id, tag_id) and
+    # (recipe_id, ingredient_id). Add the reverse order so filtering
+    # recipes by tag/ingredient ids can be answered from the index alone.
+    operations = [
+        migrations.RunSQL(
+            sql=(
+                'CREATE INDEX core_recipe_tags_tag_recipe_idx '
+                'ON core_recipe_tags (tag_id, recipe_id);'
+            ),
+            reverse_sql='DROP INDEX core_recipe_tags_tag_recipe_idx;',
+        ),
+        migrations.RunSQL(
+            sql=(
+                'CREATE INDEX core_recipe_ingredients_ingredient_recipe_idx '
+                'ON core_recipe_ingredients (ingredient_id, recipe_id);'
+            ),
+            reverse_sql=(
+                'DROP INDEX core_recipe_ingredients_ingredient_recipe_idx;'
+            ),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 3.2.25 on 2026-10-15 09:29
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0007_tag_ingredient_user_name_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='recipe',
+            index=models.Index(fields=['user', '-price'], name='core_recipe_user_id_be57fa_idx'),
+        ),
+    ]
@@ -0,0 +1,41 @@
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+
+# Django runs `icontains` as UPPER("column"::text) LIKE UPPER('%q%') on
+# PostgreSQL, so the trigram indexes are built on that same expression.
+TRGM_INDEXES = {
+    'core_recipe_title_trgm': 'title',
+    'core_recipe_description_trgm': 'description',
+}
+
+
+def create_trgm_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+
+    for name, column in TRGM_INDEXES.items():
+        schema_editor.execute(
+            f'CREATE INDEX {name} ON core_recipe '
+            f'USING gin ((UPPER({column}::text)) gin_trgm_ops);'
+        )
+
+
+def drop_trgm_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+
+    for name in TRGM_INDEXES:
+        schema_editor.execute(f'DROP INDEX {name};')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0008_recipe_user_price_index'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.RunPython(create_trgm_indexes, drop_trgm_indexes),
+    ]
@@ -72,6 +72,9 @@ class Recipe(models.Model):
     ingredients = models.ManyToManyField('Ingredient')
     image = models.ImageField(null=True, upload_to=recipe_image_file_path)
 
+    class Meta:
+        indexes = [models.Index(fields=['user', '-price'])]
+
     def __str__(self):
         return self.title
 
@@ -84,6 +87,9 @@ class Tag(models.Model):
         on_delete=models.CASCADE,
     )
 
+    class Meta:
+        indexes = [models.Index(fields=['user', 'name'])]
+
     def __str__(self) -> str:
         return self.name
 
@@ -97,5 +103,8 @@ class Ingredient(models.Model):
         on_delete=models.CASCADE,
     )
 
+    class Meta:
+        indexes = [models.Index(fields=['user', 'name'])]
+
     def __str__(self):
         return self.name
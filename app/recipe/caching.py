@@ -0,0 +1,22 @@
+"""
+Cache helpers for recipe APIs.
+"""
+import uuid
+
+from django.core.cache import cache
+
+
+def _cache_version_key(user_id):
+    return f'recipe-cache-version:{user_id}'
+
+
+def get_cache_version(user_id):
+    """Return the current cache version for a user's recipe data."""
+    return cache.get_or_set(
+        _cache_version_key(user_id), lambda: uuid.uuid4().hex, None
+    )
+
+
+def invalidate_cache(user_id):
+    """Drop every cached response derived from a user's recipe data."""
+    cache.set(_cache_version_key(user_id), uuid.uuid4().hex, None)
@@ -1,19 +1,82 @@
 """
 Filters for recipe APIs.
 """
+from functools import lru_cache
+
+from django import forms
+from django.utils.translation import gettext_lazy as _
 from django_filters import rest_framework as filters
+from rest_framework.filters import SearchFilter
 
 from core.models import Recipe
 
 
-class NumberInFilter(filters.BaseInFilter, filters.NumberFilter):
-    pass
+# Query param values which switch a boolean option on.
+TRUE_PARAM_VALUES = ('1', 'true', 'True')
+
+
+@lru_cache(maxsize=1024)
+def _parse_ids(raw):
+    """Parse a comma separated list of ids into a tuple of ints."""
+    return tuple(int(part) for part in raw.split(','))
+
+
+class IdListField(forms.CharField):
+    """Form field for a comma separated list of ids."""
+
+    default_error_messages = {
+        'invalid': _('Enter a comma separated list of ids.'),
+    }
+
+    def to_python(self, value):
+        value = super().to_python(value)
+        if value in self.empty_values:
+            return None
+
+        try:
+            return _parse_ids(value)
+        except ValueError:
+            raise forms.ValidationError(
+                self.error_messages['invalid'], code='invalid'
+            )
+
+
+class IdInFilter(filters.Filter):
+    """Filter by a comma separated list of ids."""
+
+    field_class = IdListField
+
+    def __init__(self, *args, **kwargs):
+        kwargs.setdefault('lookup_expr', 'in')
+        super().__init__(*args, **kwargs)
 
 
 class RecipeViewSetFilter(filters.FilterSet):
-    tags = NumberInFilter(field_name='tags__id', lookup_expr='in')
-    ingredients = NumberInFilter(field_name='ingredients__id', lookup_expr='in')
+    tags = IdInFilter(field_name='tags__id')
+    ingredients = IdInFilter(field_name='ingredients__id')
 
     class Meta:
         model = Recipe
         fields = ['tags', 'ingredients']
+
+
+class RecipeSearchFilter(SearchFilter):
+    """
+    Search filter which only searches related fields on request.
+
+    The view's `related_search_fields` are added to its `search_fields`
+    when `search_related` is set, as those joins need a distinct.
+    """
+    related_search_param = 'search_related'
+
+    def get_search_fields(self, view, request):
+        search_fields = super().get_search_fields(view, request)
+        related = request.query_params.get(self.related_search_param)
+
+        if related in TRUE_PARAM_VALUES:
+            search_fields = (
+                list(search_fields) +
+                list(getattr(view, 'related_search_fields', []))
+            )
+
+        return search_fields
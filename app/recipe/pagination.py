@@ -0,0 +1,79 @@
+"""
+Pagination for recipe APIs.
+"""
+from functools import partial
+
+from django.core.cache import cache
+from django.core.paginator import Paginator
+from django.utils.functional import cached_property
+from rest_framework.pagination import PageNumberPagination
+
+from recipe.caching import get_cache_version
+
+
+class CachedCountPaginator(Paginator):
+    """Paginator which keeps the total count in the cache."""
+
+    def __init__(self, *args, count_cache_key, count_cache_timeout, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.count_cache_key = count_cache_key
+        self.count_cache_timeout = count_cache_timeout
+
+    @cached_property
+    def count(self):
+        count = cache.get(self.count_cache_key)
+
+        if count is None:
+            count = super().count
+            cache.set(self.count_cache_key, count, self.count_cache_timeout)
+
+        return count
+
+
+class CachedCountPagination(PageNumberPagination):
+    """
+    Opt-in page number pagination with a cached total count.
+
+    Lists are only paginated when `page_size` is given. The count is
+    cached per user and filter, and dropped on any write to the user's
+    recipe data.
+    """
+    page_size = None
+    page_size_query_param = 'page_size'
+    max_page_size = 1000
+    count_cache_timeout = 60
+
+    def get_count_cache_key(self, request):
+        params = request.query_params.copy()
+        params.pop(self.page_query_param, None)
+        params.pop(self.page_size_query_param, None)
+
+        user_id = request.user.id
+
+        return 'recipe-count:{}:{}:{}'.format(
+            user_id,
+            get_cache_version(user_id),
+            params.urlencode(),
+        )
+
+    def get_paginated_response_schema(self, schema):
+        # Without `page_size` the list is returned as a plain array.
+        return {
+            'oneOf': [
+                schema,
+                super().get_paginated_response_schema(schema),
+            ],
+        }
+
+    def paginate_queryset(self, queryset, request, view=None):
+        # Unpaginated lists have no count, so leave the cache alone.
+        if self.get_page_size(request) is None:
+            return None
+
+        self.django_paginator_class = partial(
+            CachedCountPaginator,
+            count_cache_key=self.get_count_cache_key(request),
+            count_cache_timeout=self.count_cache_timeout,
+        )
+
+        return super().paginate_queryset(queryset, request, view=view)
@@ -0,0 +1,35 @@
+"""
+Signal handlers for recipe APIs.
+"""
+from django.db.models.signals import (
+    m2m_changed,
+    post_delete,
+    post_save,
+)
+from django.dispatch import receiver
+
+from core.models import (
+    Recipe,
+    Tag,
+    Ingredient,
+)
+from recipe.caching import invalidate_cache
+
+
+@receiver(post_save, sender=Recipe)
+@receiver(post_delete, sender=Recipe)
+@receiver(post_save, sender=Tag)
+@receiver(post_delete, sender=Tag)
+@receiver(post_save, sender=Ingredient)
+@receiver(post_delete, sender=Ingredient)
+def invalidate_owner_cache(sender, instance, **kwargs):
+    """Invalidate cached recipe data of the instance owner."""
+    invalidate_cache(instance.user_id)
+
+
+@receiver(m2m_changed, sender=Recipe.tags.through)
+@receiver(m2m_changed, sender=Recipe.ingredients.through)
+def invalidate_owner_cache_on_m2m(sender, instance, action, **kwargs):
+    """Invalidate cached recipe data when recipe relations change."""
+    if action.startswith('post_'):
+        invalidate_cache(instance.user_id)
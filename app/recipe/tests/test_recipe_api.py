@@ -0,0 +1,258 @@
+"""
+Tests for the recipe APIs.
+"""
+from decimal import Decimal
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from core.models import (
+    Recipe,
+    Tag,
+    Ingredient,
+)
+
+
+RECIPES_URL = reverse('recipe:recipe-list')
+# The tag and ingredient viewsets share their basenames with the no-mixin
+# viewsets, so reverse() would resolve to the no-mixin routes.
+TAGS_URL = '/api/recipe/tags/'
+INGREDIENTS_URL = '/api/recipe/ingredients/'
+
+LOCMEM_CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'recipe-tests',
+    }
+}
+
+
+def tag_detail_url(tag_id):
+    """Create and return a tag detail URL."""
+    return f'{TAGS_URL}{tag_id}/'
+
+
+def create_recipe(user, **params):
+    """Create and return a sample recipe."""
+    defaults = {
+        'title': 'Sample recipe title',
+        'time_minutes': 22,
+        'price': Decimal('5.25'),
+        'description': 'Sample description',
+        'link': 'http://example.com/recipe.pdf',
+    }
+    defaults.update(params)
+
+    return Recipe.objects.create(user=user, **defaults)
+
+
+def create_user(**params):
+    """Create and return a new user."""
+    return get_user_model().objects.create_user(**params)
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class PrivateRecipeApiTests(TestCase):
+    """Test authenticated API requests."""
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.user = create_user(email='user@example.com', password='test123')
+        self.client.force_authenticate(self.user)
+
+    def test_tag_list_cache_invalidated_on_patch(self):
+        """Test updating a tag refreshes the cached tag list."""
+        tag = Tag.objects.create(user=self.user, name='Breakfast')
+        self.client.get(TAGS_URL)
+
+        res = self.client.patch(tag_detail_url(tag.id), {'name': 'Dessert'})
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+
+        res = self.client.get(TAGS_URL)
+        self.assertEqual([t['name'] for t in res.data], ['Dessert'])
+
+    def test_tag_list_cache_invalidated_on_recipe_create(self):
+        """Test creating a recipe with a new tag refreshes the tag list."""
+        self.client.get(TAGS_URL)
+
+        payload = {
+            'title': 'Pancakes',
+            'time_minutes': 10,
+            'price': Decimal('2.50'),
+            'tags': [{'name': 'Breakfast'}],
+        }
+        res = self.client.post(RECIPES_URL, payload, format='json')
+        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+
+        res = self.client.get(TAGS_URL)
+        self.assertEqual([t['name'] for t in res.data], ['Breakfast'])
+
+    def test_tag_list_cache_invalidated_on_orm_write(self):
+        """Test writes outside the API refresh the cached tag list."""
+        self.client.get(TAGS_URL)
+
+        Tag.objects.create(user=self.user, name='Vegan')
+
+        res = self.client.get(TAGS_URL)
+        self.assertEqual([t['name'] for t in res.data], ['Vegan'])
+
+    def test_assigned_only_cache_invalidated_on_recipe_relation_change(self):
+        """Test assigning an item to a recipe refreshes assigned_only."""
+        cases = [
+            (TAGS_URL, Tag, 'tags'),
+            (INGREDIENTS_URL, Ingredient, 'ingredients'),
+        ]
+        recipe = create_recipe(user=self.user)
+
+        for url, model, relation in cases:
+            with self.subTest(url=url):
+                assigned = model.objects.create(user=self.user, name='Used')
+                model.objects.create(user=self.user, name='Unused')
+
+                res = self.client.get(url, {'assigned_only': 1})
+                self.assertEqual(res.data, [])
+
+                getattr(recipe, relation).add(assigned)
+
+                res = self.client.get(url, {'assigned_only': 1})
+                self.assertEqual([i['id'] for i in res.data], [assigned.id])
+
+    def test_filter_by_tags(self):
+        """Test filtering recipes by a list of tag ids."""
+        r1 = create_recipe(user=self.user, title='Thai Vegetable Curry')
+        r2 = create_recipe(user=self.user, title='Aubergine with Tahini')
+        r3 = create_recipe(user=self.user, title='Fish and chips')
+        tag1 = Tag.objects.create(user=self.user, name='Vegan')
+        tag2 = Tag.objects.create(user=self.user, name='Vegetarian')
+        r1.tags.add(tag1)
+        r2.tags.add(tag1, tag2)
+
+        res = self.client.get(RECIPES_URL, {'tags': f'{tag1.id},{tag2.id}'})
+
+        ids = [r['id'] for r in res.data]
+        self.assertEqual(sorted(ids), sorted([r1.id, r2.id]))
+        self.assertNotIn(r3.id, ids)
+
+    def test_filter_by_invalid_tags_list(self):
+        """Test malformed id lists are rejected."""
+        for value in ['1,', 'abc']:
+            res = self.client.get(RECIPES_URL, {'tags': value})
+
+            self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_list_recipes_unpaginated_by_default(self):
+        """Test recipes are returned as a plain list without page_size."""
+        create_recipe(user=self.user)
+
+        res = self.client.get(RECIPES_URL)
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertIsInstance(res.data, list)
+
+    @patch('recipe.pagination.cache')
+    @patch('recipe.caching.cache')
+    def test_list_recipes_unpaginated_skips_cache(
+        self, caching_cache, pagination_cache
+    ):
+        """Test the unpaginated list does not touch the cache."""
+        create_recipe(user=self.user)
+        caching_cache.reset_mock()
+
+        res = self.client.get(RECIPES_URL)
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(caching_cache.mock_calls, [])
+        self.assertEqual(pagination_cache.mock_calls, [])
+
+    def test_paginated_count_refreshed_after_write(self):
+        """Test the cached page count is refreshed after a write."""
+        create_recipe(user=self.user)
+        res = self.client.get(RECIPES_URL, {'page_size': 1})
+        self.assertEqual(res.data['count'], 1)
+
+        create_recipe(user=self.user)
+
+        res = self.client.get(RECIPES_URL, {'page_size': 1})
+        self.assertEqual(res.data['count'], 2)
+        self.assertEqual(len(res.data['results']), 1)
+
+    def test_search_tag_name_requires_search_related(self):
+        """Test tag names are only searched with search_related."""
+        recipe = create_recipe(user=self.user, title='Porridge')
+        recipe.tags.add(Tag.objects.create(user=self.user, name='Breakfast'))
+
+        res = self.client.get(RECIPES_URL, {'search': 'Breakfast'})
+        self.assertEqual(res.data, [])
+
+        res = self.client.get(
+            RECIPES_URL, {'search': 'Breakfast', 'search_related': 1}
+        )
+        self.assertEqual([r['id'] for r in res.data], [recipe.id])
+
+    def test_order_recipes_by_price_and_time(self):
+        """Test recipes can be ordered by price and time_minutes."""
+        r1 = create_recipe(
+            user=self.user, price=Decimal('10.00'), time_minutes=10
+        )
+        r2 = create_recipe(
+            user=self.user, price=Decimal('5.00'), time_minutes=30
+        )
+        r3 = create_recipe(
+            user=self.user, price=Decimal('7.00'), time_minutes=20
+        )
+
+        res = self.client.get(RECIPES_URL, {'ordering': 'price'})
+        self.assertEqual([r['id'] for r in res.data], [r2.id, r3.id, r1.id])
+
+        res = self.client.get(RECIPES_URL, {'ordering': 'time_minutes'})
+        self.assertEqual([r['id'] for r in res.data], [r1.id, r3.id, r2.id])
+
+    def test_assigned_only_true_values(self):
+        """Test each accepted true value enables assigned_only."""
+        assigned = Tag.objects.create(user=self.user, name='Used')
+        Tag.objects.create(user=self.user, name='Unused')
+        create_recipe(user=self.user).tags.add(assigned)
+
+        for value in ['1', 'true', 'True']:
+            with self.subTest(value=value):
+                res = self.client.get(TAGS_URL, {'assigned_only': value})
+
+                self.assertEqual(res.status_code, status.HTTP_200_OK)
+                self.assertEqual([t['id'] for t in res.data], [assigned.id])
+
+    def test_assigned_only_other_values_ignored(self):
+        """Test any other assigned_only value lists all items."""
+        assigned = Tag.objects.create(user=self.user, name='Used')
+        unassigned = Tag.objects.create(user=self.user, name='Unused')
+        create_recipe(user=self.user).tags.add(assigned)
+
+        for value in ['0', '2', 'false', 'abc', '']:
+            with self.subTest(value=value):
+                res = self.client.get(TAGS_URL, {'assigned_only': value})
+
+                self.assertEqual(res.status_code, status.HTTP_200_OK)
+                self.assertEqual(
+                    [t['id'] for t in res.data], [unassigned.id, assigned.id]
+                )
+
+    def test_list_recipes_constant_queries(self):
+        """Test listing recipes runs a fixed number of queries."""
+        for i in range(5):
+            recipe = create_recipe(user=self.user, title=f'Recipe {i}')
+            recipe.tags.add(Tag.objects.create(user=self.user, name=f'T{i}'))
+            recipe.ingredients.add(
+                Ingredient.objects.create(user=self.user, name=f'I{i}')
+            )
+
+        # Recipes, then one prefetch each for tags and ingredients.
+        with self.assertNumQueries(3):
+            res = self.client.get(RECIPES_URL)
+
+        self.assertEqual(len(res.data), 5)
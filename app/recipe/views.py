@@ -14,10 +14,13 @@ from rest_framework import (
     filters
 )
 from rest_framework.decorators import action
+from rest_framework.generics import get_object_or_404
 from rest_framework.response import Response
 from rest_framework.authentication import TokenAuthentication
 from rest_framework.permissions import IsAuthenticated
 from django_filters.rest_framework import DjangoFilterBackend
+from django.core.cache import cache
+from django.db.models import Exists, OuterRef, Q
 
 from core.models import (
     Recipe,
@@ -26,6 +29,47 @@ from core.models import (
 )
 from recipe import serializers
 from recipe import filters as my_filters
+from recipe.caching import get_cache_version
+from recipe.pagination import CachedCountPagination
+
+
+# How long (in seconds) cached tag/ingredient lists are kept.
+ATTR_LIST_CACHE_TIMEOUT = 300
+
+
+def assigned_to_recipe(model):
+    """Return an EXISTS condition matching items used by any recipe."""
+    for field in Recipe._meta.many_to_many:
+        if field.related_model is model:
+            through = field.remote_field.through
+            return Exists(through.objects.filter(
+                **{field.m2m_reverse_field_name(): OuterRef('pk')}
+            ))
+
+    raise ValueError(f'{model.__name__} is not related to recipes.')
+
+
+class RecipeAttrQuerysetMixin:
+    """Queryset handling shared by the recipe attribute viewsets."""
+
+    list_only_fields = ['id', 'name']
+
+    def get_queryset(self):
+        """Retrieve tags/ingredients for authenticated user."""
+        assigned_only = self.request.query_params.get(
+            'assigned_only'
+        ) in my_filters.TRUE_PARAM_VALUES
+        query = Q(user_id=self.request.user.id)
+        queryset = self.queryset
+
+        if self.action == 'list':
+            queryset = queryset.only(*self.list_only_fields)
+
+        if assigned_only:
+            # EXISTS never duplicates rows, so no distinct is needed.
+            return queryset.filter(query, assigned_to_recipe(queryset.model))
+
+        return queryset.filter(query)
 
 
 @extend_schema_view(
@@ -46,6 +90,11 @@ from recipe import filters as my_filters
                 OpenApiTypes.STR,
                 description='Search'
             ),
+            OpenApiParameter(
+                'search_related',
+                OpenApiTypes.INT, enum=[0, 1],
+                description='Also search tag and ingredient names.',
+            ),
             OpenApiParameter(
                 'ordering',
                 OpenApiTypes.STR,
@@ -58,45 +107,82 @@ class RecipeViewSet(viewsets.ModelViewSet):
     """View for manage recipe APIs."""
 
     serializer_class = serializers.RecipeDetailSerializer
-    queryset = Recipe.objects.all()
+    serializer_classes_by_action = {
+        'list': serializers.RecipeSerializer,
+        'upload_image': serializers.RecipeImageSerializer,
+    }
+    queryset = Recipe.objects.all().prefetch_related('tags', 'ingredients')
     authentication_classes = [TokenAuthentication]
     permission_classes = [IsAuthenticated]
-    filter_backends = [filters.OrderingFilter, filters.SearchFilter, DjangoFilterBackend]
+    filter_backends = [
+        filters.OrderingFilter,
+        my_filters.RecipeSearchFilter,
+        DjangoFilterBackend,
+    ]
     
     filterset_class = my_filters.RecipeViewSetFilter
+    pagination_class = CachedCountPagination
 
     search_fields = [
         'title',
         'description',
+    ]
+
+    # Searched only with `search_related=1`, as they join through M2M.
+    related_search_fields = [
         'tags__name',
-        'ingredients__name'
+        'ingredients__name',
     ]
 
     ordering_fields = [
         'id',
-        'time_minutes'
-        'price'
+        'time_minutes',
+        'price',
     ]
 
     ordering = ['-id']  # default ordering
 
+    # Columns read by the list serializer; the rest are deferred.
+    list_only_fields = ['id', 'title', 'time_minutes', 'price', 'link']
+
     def get_queryset(self):
         """Retrieve recipes for authenticated user."""
 
-        queryset = self.queryset
+        queryset = self.queryset.filter(user_id=self.request.user.id)
+
+        if self.action == 'list':
+            queryset = queryset.only(*self.list_only_fields)
+
+        # Only the M2M filters join through tags/ingredients and can
+        # produce duplicate rows. SearchFilter applies distinct on its own.
+        if self._has_filterset_params():
+            queryset = queryset.distinct()
+
+        return queryset
 
-        return queryset.filter(
-            user=self.request.user
-        ).distinct()
+    def _has_filterset_params(self):
+        """Check if the request uses any of the filterset query params."""
+        params = self.request.query_params
+        filter_names = self.filterset_class.base_filters
+
+        return any(name in params for name in filter_names)
+
+    def filter_queryset(self, queryset):
+        """Skip the filterset backend when none of its params are given."""
+        skip_filterset = not self._has_filterset_params()
+
+        for backend in self.filter_backends:
+            if skip_filterset and issubclass(backend, DjangoFilterBackend):
+                continue
+            queryset = backend().filter_queryset(self.request, queryset, self)
+
+        return queryset
 
     def get_serializer_class(self):
         """Return the serializer class for the request."""
-        if self.action == 'list':
-            return serializers.RecipeSerializer
-        if self.action == 'upload_image':
-            return serializers.RecipeImageSerializer
-
-        return self.serializer_class
+        return self.serializer_classes_by_action.get(
+            self.action, self.serializer_class
+        )
 
     def perform_create(self, serializer):
         """Create a new recipe."""
@@ -136,7 +222,8 @@ class RecipeViewSet(viewsets.ModelViewSet):
         ]
     )
 )
-class BaseRecipeAttrViewSet(mixins.DestroyModelMixin,
+class BaseRecipeAttrViewSet(RecipeAttrQuerysetMixin,
+                            mixins.DestroyModelMixin,
                             mixins.UpdateModelMixin,
                             mixins.ListModelMixin,
                             viewsets.GenericViewSet):
@@ -150,21 +237,24 @@ class BaseRecipeAttrViewSet(mixins.DestroyModelMixin,
 
     ordering_fields = ['id', 'name']
     
-    ordering = ['-name']
+    ordering = ['-id']
 
-    def get_queryset(self):
-        """Retrieve tags for authenticated user."""
-        assigned_only = bool(
-            int(self.request.query_params.get('assigned_only', 0))
+    def list(self, request, *args, **kwargs):
+        # Serve repeated requests from the cache.
+        user_id = request.user.id
+        cache_key = 'recipe-attrs:{}:{}:{}:{}'.format(
+            self.queryset.model._meta.model_name,
+            user_id,
+            get_cache_version(user_id),
+            request.query_params.urlencode(),
         )
-        queryset = self.queryset
+        data = cache.get(cache_key)
 
-        if assigned_only:
-            queryset = queryset.filter(recipe__isnull=False)
+        if data is None:
+            data = super().list(request, *args, **kwargs).data
+            cache.set(cache_key, data, ATTR_LIST_CACHE_TIMEOUT)
 
-        return queryset.filter(
-            user=self.request.user
-        ).distinct()
+        return Response(data)
 
 
 class TagViewSet(BaseRecipeAttrViewSet):
@@ -201,7 +291,8 @@ class IngredientViewSet(BaseRecipeAttrViewSet):
         ]
     )
 )
-class BaseRecipeAttrMixClearViewSet(viewsets.GenericViewSet):
+class BaseRecipeAttrMixClearViewSet(RecipeAttrQuerysetMixin,
+                                    viewsets.GenericViewSet):
     """ Base viewset for recipe attributes, but vithout ane mixins. """
 
     authentication_classes = [TokenAuthentication]
@@ -212,20 +303,18 @@ class BaseRecipeAttrMixClearViewSet(viewsets.GenericViewSet):
 
     ordering_fields = ['id', 'name']
     
-    ordering = ['-name']
-
-    def get_queryset(self):
-        assigned_only = bool(
-            int(self.request.query_params.get('assigned_only', 0))
+    ordering = ['-id']
+
+    def get_object(self):
+        """Retrieve item by primary key, skipping search and ordering."""
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        instance = get_object_or_404(
+            self.get_queryset(),
+            **{self.lookup_field: self.kwargs[lookup_url_kwarg]}
         )
-        queryset = self.queryset
-
-        if assigned_only:
-            queryset = queryset.filter(recipe__isnull=False)
+        self.check_object_permissions(self.request, instance)
 
-        return queryset.filter(
-            user=self.request.user
-        ).distinct()
+        return instance
 
     def update(self, request, *args, **kwargs):
         partial = kwargs.pop('partial', False)
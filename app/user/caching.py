@@ -0,0 +1,28 @@
+"""
+Cache helpers for the user API.
+"""
+import uuid
+
+from django.core.cache import cache
+
+
+# How long (in seconds) serialized `me` responses are cached.
+ME_CACHE_TIMEOUT = 120
+
+
+def _cache_version_key(user_id):
+    return f'me-cache-version:{user_id}'
+
+
+def me_cache_key(user_id):
+    """Return the cache key of the current `me` response of a user."""
+    version = cache.get_or_set(
+        _cache_version_key(user_id), lambda: uuid.uuid4().hex, None
+    )
+
+    return f'me:{user_id}:{version}'
+
+
+def invalidate_me_cache(user_id):
+    """Drop the cached `me` response of a user."""
+    cache.set(_cache_version_key(user_id), uuid.uuid4().hex, None)
@@ -0,0 +1,15 @@
+"""
+Signal handlers for the user API.
+"""
+from django.contrib.auth import get_user_model
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from user.caching import invalidate_me_cache
+
+
+@receiver(post_save, sender=get_user_model())
+@receiver(post_delete, sender=get_user_model())
+def invalidate_user_cache(sender, instance, **kwargs):
+    """Invalidate the cached `me` response of a saved user."""
+    invalidate_me_cache(instance.id)
@@ -0,0 +1,109 @@
+"""
+Tests for the user API.
+"""
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from rest_framework import status
+from rest_framework.test import APIClient
+
+
+ME_API_VIEW_URL = reverse('user:me_api_view')
+ALL_USERS_URL = reverse('user:all_users')
+
+LOCMEM_CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'user-tests',
+    }
+}
+
+
+def create_user(**params):
+    """Create and return a new user."""
+    return get_user_model().objects.create_user(**params)
+
+
+class PublicUserApiTests(TestCase):
+    """Test the public features of the user API."""
+
+    def setUp(self):
+        self.client = APIClient()
+
+    def test_list_users_paginated(self):
+        """Test the user list is returned in pages of 100 users."""
+        get_user_model().objects.bulk_create(
+            get_user_model()(email=f'user{i}@example.com', name=f'User {i}')
+            for i in range(101)
+        )
+
+        res = self.client.get(ALL_USERS_URL)
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            set(res.data), {'count', 'next', 'previous', 'results'}
+        )
+        self.assertEqual(res.data['count'], 101)
+        self.assertEqual(len(res.data['results']), 100)
+        self.assertIsNone(res.data['previous'])
+        self.assertIsNotNone(res.data['next'])
+        self.assertEqual(
+            res.data['results'][0],
+            {'email': 'user0@example.com', 'name': 'User 0'},
+        )
+
+        res = self.client.get(ALL_USERS_URL, {'page': 2})
+
+        self.assertEqual(len(res.data['results']), 1)
+        self.assertIsNone(res.data['next'])
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class PrivateUserApiTests(TestCase):
+    """Test API requests that require authentication."""
+
+    def setUp(self):
+        cache.clear()
+        self.user = create_user(
+            email='test@example.com',
+            password='testpass123',
+            name='Test Name',
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+    def test_me_cache_invalidated_on_update(self):
+        """Test updating the user refreshes the cached profile."""
+        self.client.get(ME_API_VIEW_URL)
+
+        res = self.client.patch(ME_API_VIEW_URL, {'name': 'Updated name'})
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+
+        res = self.client.get(ME_API_VIEW_URL)
+        self.assertEqual(res.data['name'], 'Updated name')
+
+    def test_me_cache_invalidated_on_orm_save(self):
+        """Test saving the user outside the API refreshes the cache."""
+        self.client.get(ME_API_VIEW_URL)
+
+        user = get_user_model().objects.get(pk=self.user.pk)
+        user.name = 'Admin edit'
+        user.save()
+        self.client.force_authenticate(user=user)
+
+        res = self.client.get(ME_API_VIEW_URL)
+        self.assertEqual(res.data['name'], 'Admin edit')
+
+    def test_me_cache_stores_current_data(self):
+        """Test a cache miss stores the saved user, not request.user."""
+        stale_user = get_user_model().objects.get(pk=self.user.pk)
+        self.user.name = 'Saved name'
+        self.user.save()
+        self.client.force_authenticate(user=stale_user)
+
+        self.client.get(ME_API_VIEW_URL)
+        res = self.client.get(ME_API_VIEW_URL)
+
+        self.assertEqual(res.data['name'], 'Saved name')
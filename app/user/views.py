@@ -3,17 +3,20 @@ Views for the user API
 """
 from rest_framework import mixins, generics, authentication, permissions
 from rest_framework.authtoken.views import ObtainAuthToken
+from rest_framework.pagination import PageNumberPagination
 from rest_framework.settings import api_settings
 from rest_framework.views import APIView
 from rest_framework.response import Response
 
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
 
 from user.serializers import (
     UserSerializer,
     AuthTokenSerializer,
     ListUserSerializer,
     )
+from user.caching import ME_CACHE_TIMEOUT, me_cache_key
 
 
 class CreateUserView(generics.CreateAPIView):
@@ -79,22 +82,29 @@ class ManageUserApiView(APIView):
     # For Swagger documentation
 
     def get(self, request, *args, **kwargs):
-        return Response(UserSerializer(self.request.user).data)
+        user_id = request.user.id
+        cache_key = me_cache_key(user_id)
+        data = cache.get(cache_key)
 
-    def put(self, request, *args, **kwargs):
+        if data is None:
+            # request.user was loaded before the cache version was read,
+            # so reload it to avoid caching a concurrent write's old data.
+            user = get_user_model().objects.get(pk=user_id)
+            data = self.get_serializer(user).data
+            cache.set(cache_key, data, ME_CACHE_TIMEOUT)
 
-        serializer = self.serializer_class(
-            self.request.user, data=request.data
-        )
-        serializer.is_valid(raise_exception=True)
-        serializer.save()
+        return Response(data)
 
-        return Response(serializer.data)
+    def put(self, request, *args, **kwargs):
+        return self._update(request, partial=False)
 
     def patch(self, request, *args, **kwargs):
+        return self._update(request, partial=True)
 
-        serializer = self.serializer_class(
-            self.request.user, data=request.data, partial=True
+    def _update(self, request, partial):
+        """Update the authenticated user, fully or partially."""
+        serializer = self.get_serializer(
+            request.user, data=request.data, partial=partial
         )
         serializer.is_valid(raise_exception=True)
         serializer.save()
@@ -102,12 +112,28 @@ class ManageUserApiView(APIView):
         return Response(serializer.data)
 
 
+class ListUsersPagination(PageNumberPagination):
+    """Pagination for the list of all users."""
+    page_size = 100
+    page_size_query_param = 'page_size'
+    max_page_size = 1000
+
+
 class ListAllUsersApiView(APIView):
+    """List all users in the system, paginated."""
+
+    pagination_class = ListUsersPagination
 
     def get(self, request, *args, **kwargs):
 
-        queryset = get_user_model().objects.all()
+        # Only fetch the serialized columns and skip building model instances.
+        queryset = get_user_model().objects.order_by('id').values(
+            'email', 'name'
+        )
 
-        serializer = ListUserSerializer(queryset, many=True)
+        paginator = self.pagination_class()
+        page = paginator.paginate_queryset(queryset, request, view=self)
 
-        return Response(serializer.data)
+        serializer = ListUserSerializer(page, many=True)
+
+        return paginator.get_paginated_response(serializer.data)